@@ -36,12 +36,10 @@ def block_plot(covmat: np.ndarray, block_size: int, filename: Optional[str] = No
 
     # coarse grain it in nxn blocks
     n = block_size
-    indices = np.arange(dim - 1)[::n]
-    blocked = np.add.reduceat(np.add.reduceat(covmat, indices), indices, axis=1)
+    nblocks = dim // n
     # drop leftover
-    last = indices[-1]
-    if last != dim - n:
-        blocked = blocked[:-1, :-1]
+    trimmed = covmat[: nblocks * n, : nblocks * n]
+    blocked = trimmed.reshape(nblocks, n, nblocks, n).sum(axis=(1, 3))
 
     sns.heatmap(blocked)
     plt.xticks()
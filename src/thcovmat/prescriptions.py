@@ -8,15 +8,133 @@ not, according to the prescriptions).
 The generalized prescriptions are provided as separate functions.
 
 Since prescriptions are realized through masks, and normalization are dependent
-on mass weights, even weights different from 0 or 1 could be used.
+on mass weights, even weights different from 0 or 1 could be used (the masks
+provided here are boolean, selecting the scale variations that are included).
 
 """
+import functools
 from dataclasses import dataclass
 from typing import Optional, Sequence
 
 import numpy as np
 
 
+def _centre(shape: tuple[int, int], f0: Optional[int], r0: Optional[int]):
+    """Resolve the central scales, defaulting to the middle of each axis."""
+    return (shape[0] // 2 if f0 is None else f0, shape[1] // 2 if r0 is None else r0)
+
+
+def _cached_mask(builder):
+    """Memoize a mask builder, freezing the masks it returns.
+
+    The cached arrays are shared among all callers, so they are made read-only:
+    a private copy has to be taken before modifying them.
+
+    The central value is left untouched, since it is nullified once and for
+    all by :class:`Prescription` itself.
+
+    """
+
+    @functools.lru_cache(maxsize=64)
+    @functools.wraps(builder)
+    def cached(shape: tuple[int, int], f0: Optional[int], r0: Optional[int]):
+        mask = builder(shape, *_centre(shape, f0, r0))
+        mask.flags.writeable = False
+        return mask
+
+    return cached
+
+
+@_cached_mask
+def _ren_mask(shape, f0, r0):
+    mask = np.zeros(shape, dtype=bool)
+    mask[f0] = True
+    return mask
+
+
+@_cached_mask
+def _fact_mask(shape, f0, r0):
+    mask = np.zeros(shape, dtype=bool)
+    mask[:, r0] = True
+    return mask
+
+
+@_cached_mask
+def _sum_mask(shape, f0, r0):
+    mask = np.zeros(shape, dtype=bool)
+    idx = np.arange(min(shape))
+    mask[idx, idx] = True
+    return mask
+
+
+@_cached_mask
+def _antisum_mask(shape, f0, r0):
+    mask = np.zeros(shape, dtype=bool)
+    idx = np.arange(min(shape))
+    mask[shape[0] - 1 - idx, idx] = True
+    return mask
+
+
+@_cached_mask
+def _christ_mask(shape, f0, r0):
+    mask = np.zeros(shape, dtype=bool)
+    np.logical_or(_ren_mask(shape, f0, r0), _fact_mask(shape, f0, r0), out=mask)
+    return mask
+
+
+@_cached_mask
+def _standrews_mask(shape, f0, r0):
+    mask = np.zeros(shape, dtype=bool)
+    np.logical_or(_sum_mask(shape, f0, r0), _antisum_mask(shape, f0, r0), out=mask)
+    return mask
+
+
+@_cached_mask
+def _tridiag_mask(shape, f0, r0):
+    # start from the main diagonal, i.e. the fully correlated mask
+    mask = _sum_mask(shape, f0, r0).copy()
+    idx = np.arange(min(shape))
+    # sub and super diagonals
+    sub = idx[: min(shape[0] - 1, shape[1])]
+    mask[sub + 1, sub] = True
+    sup = idx[: min(shape[0], shape[1] - 1)]
+    mask[sup, sup + 1] = True
+    return mask
+
+
+@_cached_mask
+def _antitridiag_mask(shape, f0, r0):
+    # start from the main anti-diagonal, i.e. the fully anti-correlated mask
+    mask = _antisum_mask(shape, f0, r0).copy()
+    last = shape[0] - 1
+    idx = np.arange(min(shape))
+    # sub and super anti-diagonals
+    sub = idx[: min(shape[0], shape[1] - 1)]
+    mask[last - sub, sub + 1] = True
+    sup = idx[: min(shape[0] - 1, shape[1])]
+    mask[last - 1 - sup, sup] = True
+    return mask
+
+
+@_cached_mask
+def _incoherent_mask(shape, f0, r0):
+    return np.ones(shape, dtype=bool)
+
+
+# mask builders and names of the prescriptions, by constructor
+_PRESCRIPTIONS = {
+    "ren": (_ren_mask, "Renormalization only"),
+    "fact": (_fact_mask, "Factorization only"),
+    "sum": (_sum_mask, "Fully correlated"),
+    "antisum": (_antisum_mask, "Fully anti-correlated"),
+    "christ": (_christ_mask, "Christ"),
+    "standrews": (_standrews_mask, "St Andrews"),
+    "tridiag": (_tridiag_mask, "Tridiagonal"),
+    "antitridiag": (_antitridiag_mask, "Anti-tridiagonal"),
+    "incoherent": (_incoherent_mask, "Fully incoherent"),
+}
+
+
 @dataclass
 class Prescription:
     mask: np.ndarray
@@ -37,107 +155,86 @@ class Prescription:
     def nullify_central(self):
         """Remove central value, since it's a zero shift."""
         # set to null
-        self.mask[self.f0, self.r0] = 0
+        self.mask[self.f0, self.r0] = False
+
+    @classmethod
+    def _build(
+        cls, kind: str, shape: Sequence[int], f0: Optional[int], r0: Optional[int]
+    ):
+        """Wrap a private copy of the cached mask of the given kind."""
+        builder, name = _PRESCRIPTIONS[kind]
+        return cls(builder(tuple(shape), f0, r0).copy(), name=name, f0=f0, r0=r0)
 
     @classmethod
     def ren(
         cls, shape: Sequence[int], f0: Optional[int] = None, r0: Optional[int] = None
     ):
         """a.k.a. 3 point renormalization."""
-        prescr = cls(np.zeros(shape), name="Renormalization only", f0=f0, r0=r0)
-        prescr.mask[prescr.f0] = 1
-        prescr.nullify_central()
-        return prescr
+        return cls._build("ren", shape, f0, r0)
 
     @classmethod
     def fact(
         cls, shape: Sequence[int], f0: Optional[int] = None, r0: Optional[int] = None
     ):
         """a.k.a. 3 point factorization."""
-        prescr = cls(np.zeros(shape), name="Factorization only", f0=f0, r0=r0)
-        prescr.mask[:, prescr.r0] = 1
-        prescr.nullify_central()
-        return prescr
+        return cls._build("fact", shape, f0, r0)
 
     @classmethod
     def sum(
         cls, shape: Sequence[int], f0: Optional[int] = None, r0: Optional[int] = None
     ):
         """a.k.a. 3 point correlated."""
-        prescr = cls(np.zeros(shape), name="Fully correlated", f0=f0, r0=r0)
-        np.fill_diagonal(prescr.mask, 1)
-        prescr.nullify_central()
-        return prescr
+        return cls._build("sum", shape, f0, r0)
 
     @classmethod
     def antisum(
         cls, shape: Sequence[int], f0: Optional[int] = None, r0: Optional[int] = None
     ):
         """a.k.a. 3 point anti-correlated."""
-        prescr = cls(np.zeros(shape), name="Fully anti-correlated", f0=f0, r0=r0)
-        np.fill_diagonal(prescr.mask[::-1], 1)
-        prescr.nullify_central()
-        return prescr
+        return cls._build("antisum", shape, f0, r0)
 
     @classmethod
     def christ(
         cls, shape: Sequence[int], f0: Optional[int] = None, r0: Optional[int] = None
     ):
         """a.k.a. 5 point."""
-        el1 = cls.ren(shape, f0=f0, r0=r0)
-        el2 = cls.fact(shape, f0=f0, r0=r0)
-        return cls(np.logical_or(el1.mask, el2.mask) * 1.0, name="Christ", f0=f0, r0=r0)
+        return cls._build("christ", shape, f0, r0)
 
     @classmethod
     def standrews(
         cls, shape: Sequence[int], f0: Optional[int] = None, r0: Optional[int] = None
     ):
         """a.k.a. 5 point correlated."""
-        el1 = cls.sum(shape, f0=f0, r0=r0)
-        el2 = cls.antisum(shape, f0=f0, r0=r0)
-        return cls(
-            np.logical_or(el1.mask, el2.mask) * 1.0, name="St Andrews", f0=f0, r0=r0
-        )
+        return cls._build("standrews", shape, f0, r0)
 
     @classmethod
     def tridiag(
         cls, shape: Sequence[int], f0: Optional[int] = None, r0: Optional[int] = None
     ):
         """a.k.a. 7 point correlated."""
-        prescr = cls(np.zeros(shape), name="Tridiagonal", f0=f0, r0=r0)
-        np.fill_diagonal(prescr.mask, 1)
-        np.fill_diagonal(prescr.mask[1:], 1)
-        np.fill_diagonal(prescr.mask[:, 1:], 1)
-        prescr.nullify_central()
-        return prescr
+        return cls._build("tridiag", shape, f0, r0)
 
     @classmethod
     def antitridiag(
         cls, shape: Sequence[int], f0: Optional[int] = None, r0: Optional[int] = None
     ):
         """a.k.a. 7 point anti-correlated."""
-        prescr = cls(np.zeros(shape), name="Anti-tridiagonal", f0=f0, r0=r0)
-        np.fill_diagonal(prescr.mask[::-1], 1)
-        np.fill_diagonal(prescr.mask[::-1, 1:], 1)
-        np.fill_diagonal(prescr.mask[-2::-1, :], 1)
-        prescr.nullify_central()
-        return prescr
+        return cls._build("antitridiag", shape, f0, r0)
 
     @classmethod
     def incoherent(
         cls, shape: Sequence[int], f0: Optional[int] = None, r0: Optional[int] = None
     ):
         """a.k.a. 9 point."""
-        prescr = cls(np.ones(shape), name="Fully incoherent", f0=f0, r0=r0)
-        return prescr
+        return cls._build("incoherent", shape, f0, r0)
 
     @property
     def s(self) -> int:
         """Number of independent scales."""
-        m = self.mask.copy()
-
-        m[self.f0, self.r0] = 1
-        return np.log(np.sum(m**2)) / np.log(np.sum(m.shape) / 2)
+        # count the central scale as enabled, whatever its value in the mask
+        central = self.mask[self.f0, self.r0]
+        squares = np.sum(np.square(self.mask)) - central**2 + 1
+        return np.log(squares) / np.log(sum(self.mask.shape) / 2)
 
     @property
     def m(self) -> int:
@@ -189,6 +286,28 @@ class Prescription:
         return self.norm / self.mask.shape[1]
 
 
+# the prescriptions collected by :func:`nbym`, with their constructors
+_NBYM = (
+    ("3", "ren"),
+    ("3b", "fact"),
+    ("3c", "sum"),
+    ("3cb", "antisum"),
+    ("5", "christ"),
+    ("5b", "standrews"),
+    ("7", "tridiag"),
+    ("7b", "antitridiag"),
+    ("9", "incoherent"),
+)
+
+
+@functools.lru_cache(maxsize=64)
+def _nbym_masks(shape: tuple[int, int]) -> np.ndarray:
+    """Stack all the :func:`nbym` masks in a single read-only array."""
+    masks = np.stack([_PRESCRIPTIONS[kind][0](shape, None, None) for _, kind in _NBYM])
+    masks.flags.writeable = False
+    return masks
+
+
 def nbym(n: int = 3, m: Optional[int] = None) -> dict[str, Prescription]:
     """Create integer masks' dictionary.
 
@@ -208,16 +327,11 @@ def nbym(n: int = 3, m: Optional[int] = None) -> dict[str, Prescription]:
     if m is None:
         m = n
 
-    prescriptions = {}
+    # a single copy for all the masks, each prescription holds a view on it
+    masks = _nbym_masks((n, m)).copy()
 
-    prescriptions["3"] = Prescription.ren((n, m))
-    prescriptions["3b"] = Prescription.fact((n, m))
-    prescriptions["3c"] = Prescription.sum((n, m))
-    prescriptions["3cb"] = Prescription.antisum((n, m))
-    prescriptions["5"] = Prescription.christ((n, m))
-    prescriptions["5b"] = Prescription.standrews((n, m))
-    prescriptions["7"] = Prescription.tridiag((n, m))
-    prescriptions["7b"] = Prescription.antitridiag((n, m))
-    prescriptions["9"] = Prescription.incoherent((n, m))
+    prescriptions = {}
+    for (key, kind), mask in zip(_NBYM, masks):
+        prescriptions[key] = Prescription(mask, name=_PRESCRIPTIONS[kind][1])
 
     return prescriptions
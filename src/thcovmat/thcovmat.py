@@ -17,10 +17,14 @@ Comparison with the old method:
   :func:`thcovmat`)
 
 """
-from typing import Iterable
+import math
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable, Optional
 
 import numpy as np
 
+_rng = np.random.default_rng()
+
 
 def raw_shifts(sizes: Iterable[int]) -> list[np.ndarray]:
     """Generate a sample of theory shifts.
@@ -53,9 +57,11 @@ def raw_shifts(sizes: Iterable[int]) -> list[np.ndarray]:
         - the third dimension is the renormalization scale specific for the
           process
 
+        Shifts are stored in single precision, to halve their footprint.
+
     """
     return [
-        np.random.normal(loc=10 * i, scale=i, size=(batch, 3, 3))
+        _rng.standard_normal((batch, 3, 3), dtype=np.float32) * i + 10 * i
         for i, batch in enumerate(sizes)
     ]
 
@@ -88,16 +94,17 @@ def shifts_vec(raw: list[np.ndarray]) -> list[np.ndarray]:
     """
     upgraded = []
     n = len(raw)
-    dims = list(np.arange(n) + 2)
     for i, batch in enumerate(raw):
-        newdims = dims.copy()
-        newdims.remove(i + 2)
-        upgraded.append(np.expand_dims(batch, newdims))
+        # only the renormalization dimension of the process itself is
+        # non-trivial
+        shape = [*batch.shape[:2]] + [1] * n
+        shape[i + 2] = batch.shape[2]
+        upgraded.append(batch.reshape(shape))
 
     return upgraded
 
 
-def thcovmat(shifts: list[np.ndarray]) -> np.ndarray:
+def thcovmat(shifts: list[np.ndarray], max_workers: Optional[int] = 1) -> np.ndarray:
     """Generate theory covariance matrix from upgraded vector of shifts.
 
     Exploit `numpy` broadcasting to apply Eq.(4.2) of arXiv:1906.10698
@@ -146,11 +153,26 @@ def thcovmat(shifts: list[np.ndarray]) -> np.ndarray:
       factor of 3 is multiplied, in order to make it homogeneous with the
       off-diagonal blocks
 
+    Since in the off-diagonal blocks the two renormalization scales are never
+    shared, the contraction factorizes: each shift can be summed over its own
+    renormalization scale first, and only the factorization scale is left to
+    be contracted. In this form all the processes can be stacked together, and
+    each off-diagonal block is obtained out of a single product of their
+    slices; moreover, only the upper triangle has to be computed, since the
+    lower one is its transpose.
+
 
     Parameters
     ----------
     raw : list[np.ndarray]
         sequence of upgraded shifts, like those generated by :func:`shifts_vec`
+    max_workers : int or None
+        number of threads used to compute the blocks concurrently; by default
+        they are computed sequentially, since BLAS is usually multithreaded
+        already, and further threads would only oversubscribe the CPU (with a
+        multithreaded BLAS, it should not exceed ``cpu_count // blas_threads``);
+        ``None`` selects the default of
+        :class:`concurrent.futures.ThreadPoolExecutor`
 
     Returns
     -------
@@ -166,25 +188,58 @@ def thcovmat(shifts: list[np.ndarray]) -> np.ndarray:
       renormalization scales
 
     """
-    blockmat = []
-    sumdims = list(np.arange(len(shifts) + 1) + 2)
-
     # for each process there is only one non-trivial renormalization scale, so
     # the other dimensions have to be 1
-    murs = np.array(shifts[0].shape[2:]).prod()
-    if not all(np.array(proc_shift.shape[2:]).prod() == murs for proc_shift in shifts):
+    murs = math.prod(shifts[0].shape[2:])
+    if not all(math.prod(proc_shift.shape[2:]) == murs for proc_shift in shifts):
         raise ValueError(
             "All the different renormalization scales should have the"
             " same number of points"
         )
 
-    for bi in shifts:
-        blockrow = []
-        for bj in shifts:
-            degeneracy = murs if bi is bj else 1.0
-            blockrow.append(
-                np.einsum(bi, [0, *sumdims], bj, [1, *sumdims], [0, 1]) * degeneracy
-            )
-        blockmat.append(blockrow)
-
-    return np.block(blockmat)
+    # off-diagonal: sum over the renormalization scale, and contract all the
+    # processes together on the factorization scale; the operands are promoted
+    # to double precision, that is always used for the accumulation
+    collapsed = np.concatenate(
+        [
+            proc_shift.sum(axis=tuple(range(2, proc_shift.ndim)), dtype=np.float64)
+            for proc_shift in shifts
+        ]
+    )
+    offsets = np.cumsum([0] + [proc_shift.shape[0] for proc_shift in shifts])
+    mat = np.empty((offsets[-1], offsets[-1]))
+
+    def block(i: int, j: int):
+        rows = slice(offsets[i], offsets[i + 1])
+        cols = slice(offsets[j], offsets[j + 1])
+        if i == j:
+            # on-diagonal: the renormalization scale is shared, so it has to be
+            # contracted as well, compensating with the degeneracy factor
+            # (applied on one operand, that is much smaller than the block); all
+            # the dimensions but the data one are contracted, so they can be
+            # flattened
+            bi = shifts[i]
+            flat = bi.reshape(bi.shape[0], math.prod(bi.shape[1:]))
+            flat = flat.astype(np.float64, copy=False)
+            np.matmul(murs * flat, flat.T, out=mat[rows, rows])
+        else:
+            # the matrix is symmetric: compute the block above the diagonal,
+            # and mirror it below
+            upper = mat[rows, cols]
+            np.matmul(collapsed[rows], collapsed[cols].T, out=upper)
+            mat[cols, rows] = upper.T
+
+    pairs = [(i, j) for i in range(len(shifts)) for j in range(i, len(shifts))]
+    if max_workers == 1 or len(shifts) == 1:
+        for i, j in pairs:
+            block(i, j)
+    else:
+        # each block writes on a disjoint region of the matrix, and `numpy`
+        # releases the GIL during the products
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(block, i, j) for i, j in pairs]
+            # propagate exceptions
+            for future in futures:
+                future.result()
+
+    return mat